@@ -6,30 +6,114 @@ The API allows external interfaces to interact with the agent via HTTP requests.
 Endpoints:
     GET  /              - API information
     GET  /health        - Health check
-    POST /api/query     - Send question to agent
+    POST /api/query     - Queue question for the agent, returns a job id
+    GET  /api/query/{job_id}        - Job status and answer when complete
+    WS   /api/query/{job_id}/events - Job status updates until completion
+    POST /api/query/stream - Send question to agent, stream events (SSE)
     GET  /api/sessions  - List active sessions (future feature)
 
-Run with: uvicorn api:app --reload --host 0.0.0.0 --port 8000
+Queued questions are executed by the background worker (see worker.py),
+which needs Redis:
+    arq worker.WorkerSettings
+
+Run with:
+    python api.py --dev          # single worker, auto-reload
+    python api.py --workers 4    # production, multiple worker processes
+
+Alternatively, run under gunicorn as the process manager:
+    gunicorn api:app -k uvicorn.workers.UvicornWorker -w $((2 * $(nproc) + 1)) -b 0.0.0.0:8000
 """
 
 # ============================================================================
 # IMPORTS
 # ============================================================================
 
+import asyncio
+import dataclasses
+import json
+import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException
+from arq import ArqRedis, create_pool
+from arq.jobs import Job, JobStatus
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from redis.exceptions import RedisError
 
 # Add scripts folder to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 # Import agent
-from deep_agent import run_agent
+from langchain.chat_models import init_chat_model
+from tavily import TavilyClient
+
+from deep_agent import (
+    SUMMARIZATION_MODEL_NAME,
+    astream_agent,
+    configure_logging,
+    create_httpx_client,
+    set_clients,
+)
+from worker import REDIS_SETTINGS
+
+configure_logging()
+log = logging.getLogger("api")
+log.setLevel(logging.INFO)  # Show startup/shutdown messages
+
+JOB_POLL_INTERVAL = 1.0  # seconds between job status checks on the events socket
+
+# Comma-separated list of frontend origins allowed to call the API
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+CORS_MAX_AGE = 86400  # seconds browsers may cache preflight responses
+
+# Reconnecting from a request must fail fast instead of using arq's retries
+RECONNECT_REDIS_SETTINGS = dataclasses.replace(REDIS_SETTINGS, conn_retries=0)
+# Errors raised when Redis is unreachable
+QUEUE_ERRORS = (OSError, RedisError, TimeoutError)
+
+
+# ============================================================================
+# LIFESPAN (STARTUP/SHUTDOWN)
+# ============================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients on API startup and release them on shutdown."""
+    # Search client, summarization model and HTTP client used by the search tool
+    app.state.tavily = TavilyClient()
+    app.state.summarizer = init_chat_model(model=SUMMARIZATION_MODEL_NAME)
+    app.state.httpx = create_httpx_client()
+    set_clients(
+        tavily=app.state.tavily,
+        summarizer=app.state.summarizer,
+        http_client=app.state.httpx,
+    )
+    # Connection pool to the job queue; the API still starts if Redis is down
+    app.state.arq_pool = None
+    try:
+        app.state.arq_pool = await create_pool(REDIS_SETTINGS)
+    except QUEUE_ERRORS as e:
+        log.warning("⚠️ Job queue unavailable, will retry on first request: %s", e)
+
+    log.info("🚀 Deep Research Agent API starting (docs at /docs, health at /health)")
+    yield
+    log.info("👋 Deep Research Agent API shutting down")
+
+    # Close pooled connections of the shared HTTP client and job queue
+    await app.state.httpx.aclose()
+    if app.state.arq_pool is not None:
+        await app.state.arq_pool.aclose()
 
 
 # ============================================================================
@@ -41,18 +125,23 @@ app = FastAPI(
     description="REST API for Deep Research Agent powered by LangGraph",
     version="1.0.0",
     docs_url="/docs",  # Swagger UI at http://localhost:8000/docs
-    redoc_url="/redoc"  # ReDoc at http://localhost:8000/redoc
+    redoc_url="/redoc",  # ReDoc at http://localhost:8000/redoc
+    lifespan=lifespan
 )
 
 # Configure CORS (allow requests from frontend)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE,
 )
 
+# Compress responses larger than 1 KB (long answers, job results)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -94,6 +183,32 @@ class QueryResponse(BaseModel):
         }
 
 
+class JobResponse(BaseModel):
+    """Response model for a queued agent query."""
+    job_id: str = Field(description="Identifier of the queued job")
+    status: str = Field(description="Job status")
+    status_url: str = Field(description="URL to poll for the job result")
+    events_url: str = Field(description="WebSocket URL for job status updates")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f9c2b6e8a0d4c1f9e7b5a2d6c8e0f14",
+                "status": "queued",
+                "status_url": "/api/query/3f9c2b6e8a0d4c1f9e7b5a2d6c8e0f14",
+                "events_url": "/api/query/3f9c2b6e8a0d4c1f9e7b5a2d6c8e0f14/events"
+            }
+        }
+
+
+class JobStatusResponse(BaseModel):
+    """Response model for the status of a queued agent query."""
+    job_id: str = Field(description="Identifier of the queued job")
+    status: str = Field(description="queued, deferred, in_progress, complete or failed")
+    result: Optional[QueryResponse] = Field(default=None, description="Agent answer once complete")
+    error: Optional[str] = Field(default=None, description="Error message if the job failed")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str
@@ -114,7 +229,10 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "health": "GET /health",
-            "query": "POST /api/query"
+            "query": "POST /api/query",
+            "query_status": "GET /api/query/{job_id}",
+            "query_events": "WS /api/query/{job_id}/events",
+            "query_stream": "POST /api/query/stream"
         }
     }
 
@@ -133,71 +251,186 @@ async def health_check():
     }
 
 
-@app.post("/api/query", response_model=QueryResponse, tags=["Agent"])
+@app.post("/api/query", response_model=JobResponse, status_code=202, tags=["Agent"])
 async def query_agent(request: QueryRequest):
-    """Send a question to the Deep Research Agent.
+    """Queue a question for the Deep Research Agent.
     
-    This endpoint processes user questions using the LangGraph agent,
-    which performs web searches, analyzes results, and generates comprehensive answers.
+    The agent run is executed by the background worker, which performs web
+    searches, analyzes results, and generates comprehensive answers. Poll
+    ``status_url`` or listen on ``events_url`` for the result.
     
     Args:
         request: Query request with question and options
         
     Returns:
-        Agent's answer and metadata
+        Job id and URLs to follow the job
         
     Raises:
-        HTTPException: If agent execution fails
+        HTTPException: If the job cannot be queued
     """
+    arq_pool = await _get_arq_pool()
     try:
-        # Run agent
-        result = run_agent(
-            question=request.question,
-            verbose=request.verbose
+        job = await arq_pool.enqueue_job(
+            "run_agent_job",
+            request.question,
+            request.verbose
         )
+    except Exception as e:
+        log.exception("❌ Error queuing query: %s", e)
         
-        # Format response
-        return QueryResponse(
+        raise HTTPException(
+            status_code=503,
+            detail=f"Could not queue agent job: {str(e)}"
+        )
+    
+    return JobResponse(
+        job_id=job.job_id,
+        status=JobStatus.queued.value,
+        status_url=f"/api/query/{job.job_id}",
+        events_url=f"/api/query/{job.job_id}/events"
+    )
+
+
+async def _get_arq_pool() -> ArqRedis:
+    """Get the job queue pool, connecting now if Redis was down at startup.
+    
+    Raises:
+        HTTPException: If the job queue is unavailable
+    """
+    if app.state.arq_pool is None:
+        try:
+            app.state.arq_pool = await create_pool(RECONNECT_REDIS_SETTINGS)
+        except QUEUE_ERRORS as e:
+            log.warning("⚠️ Job queue unavailable: %s", e)
+            raise HTTPException(status_code=503, detail="Job queue unavailable")
+    return app.state.arq_pool
+
+
+async def _get_job_status(job_id: str) -> JobStatusResponse:
+    """Look up a queued job and build its status response.
+    
+    Raises:
+        HTTPException: If the job queue is unavailable
+    """
+    job = Job(job_id, await _get_arq_pool())
+    try:
+        status = await job.status()
+        info = await job.result_info() if status == JobStatus.complete else None
+    except QUEUE_ERRORS as e:
+        log.warning("⚠️ Job queue unavailable: %s", e)
+        raise HTTPException(status_code=503, detail="Job queue unavailable")
+    
+    if status != JobStatus.complete:
+        return JobStatusResponse(job_id=job_id, status=status.value)
+    
+    if info is None:
+        # Result expired between the two lookups
+        return JobStatusResponse(job_id=job_id, status=JobStatus.not_found.value)
+    if not info.success:
+        return JobStatusResponse(
+            job_id=job_id,
+            status="failed",
+            error=f"Agent execution failed: {str(info.result)}"
+        )
+    
+    result = info.result
+    return JobStatusResponse(
+        job_id=job_id,
+        status=status.value,
+        result=QueryResponse(
             success=True,
             answer=result["answer"],
             question=result["question"],
             message_count=result["message_count"],
-            timestamp=datetime.now().isoformat(),
-            files_created=len(result.get("files", {}))
-        )
-        
-    except Exception as e:
-        # Log error (in production, use proper logging)
-        print(f"❌ Error processing query: {str(e)}")
-        
-        raise HTTPException(
-            status_code=500,
-            detail=f"Agent execution failed: {str(e)}"
+            timestamp=info.finish_time.isoformat(),
+            files_created=result["file_count"]
         )
+    )
 
 
-# ============================================================================
-# STARTUP/SHUTDOWN EVENTS
-# ============================================================================
+@app.get("/api/query/{job_id}", response_model=JobStatusResponse, tags=["Agent"])
+async def query_status(job_id: str):
+    """Get the status of a queued question, with the answer once complete.
+    
+    Args:
+        job_id: Identifier returned by ``POST /api/query``
+        
+    Returns:
+        Job status, and the agent's answer and metadata when complete
+        
+    Raises:
+        HTTPException: If the job does not exist or the job queue is unavailable
+    """
+    job_status = await _get_job_status(job_id)
+    if job_status.status == JobStatus.not_found.value:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job_status
 
-@app.on_event("startup")
-async def startup_event():
-    """Actions to perform on API startup."""
-    print("\n" + "="*80)
-    print("🚀 Deep Research Agent API Starting...")
-    print("="*80)
-    print(f"📍 API Documentation: http://localhost:8000/docs")
-    print(f"🔍 ReDoc: http://localhost:8000/redoc")
-    print(f"💡 Health Check: http://localhost:8000/health")
-    print("="*80 + "\n")
 
+@app.websocket("/api/query/{job_id}/events")
+async def query_events(websocket: WebSocket, job_id: str):
+    """Send job status updates over a WebSocket until the job finishes.
+    
+    A JSON status message is sent on every status change; the last one
+    carries the result (or error) and the socket is then closed. If the job
+    queue is unavailable, the socket is closed with code 1013 (try again later).
+    
+    Args:
+        websocket: Client connection
+        job_id: Identifier returned by ``POST /api/query``
+    """
+    await websocket.accept()
+    last_status = None
+    try:
+        while True:
+            job_status = await _get_job_status(job_id)
+            if job_status.status != last_status:
+                await websocket.send_json(job_status.model_dump())
+                last_status = job_status.status
+            if job_status.status in ("complete", "failed", "not_found"):
+                break
+            await asyncio.sleep(JOB_POLL_INTERVAL)
+        await websocket.close()
+    except HTTPException as e:
+        await websocket.close(code=1013, reason=e.detail)
+    except WebSocketDisconnect:
+        pass
+
+
+def _json_default(obj):
+    """Serialize values in stream events that json cannot handle natively."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+@app.post("/api/query/stream", tags=["Agent"])
+async def query_agent_stream(request: QueryRequest):
+    """Send a question to the Deep Research Agent and stream its progress.
+    
+    Events (model tokens, tool calls, node updates) are sent as
+    Server-Sent Events while the agent runs, instead of one response
+    at the end.
+    
+    Args:
+        request: Query request with question and options
+        
+    Returns:
+        ``text/event-stream`` response with one JSON event per message
+    """
+    async def event_stream():
+        try:
+            async for event in astream_agent(
+                question=request.question,
+                verbose=request.verbose
+            ):
+                yield f"data: {json.dumps(event, default=_json_default)}\n\n"
+        except Exception as e:
+            log.exception("❌ Error streaming query: %s", e)
+            error = {"detail": f"Agent execution failed: {str(e)}"}
+            yield f"event: error\ndata: {json.dumps(error)}\n\n"
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Actions to perform on API shutdown."""
-    print("\n" + "="*80)
-    print("👋 Deep Research Agent API Shutting Down...")
-    print("="*80 + "\n")
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 # ============================================================================
@@ -205,12 +438,47 @@ async def shutdown_event():
 # ============================================================================
 
 if __name__ == "__main__":
+    import argparse
+
     import uvicorn
-    
-    uvicorn.run(
-        "api:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,  # Auto-reload on code changes
-        log_level="info"
+
+    parser = argparse.ArgumentParser(description="Run the Deep Research Agent API")
+    parser.add_argument("--host", default="0.0.0.0", help="Bind host")
+    parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Single worker with auto-reload on code changes",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", "4")),
+        help="Number of worker processes (default: $WEB_CONCURRENCY or 4)",
     )
+    args = parser.parse_args()
+
+    # uvicorn's default loop/http ("auto") use uvloop and httptools from
+    # uvicorn[standard] when available, and fall back on Windows
+    if args.dev:
+        # Development: one process, reloads on code changes
+        uvicorn.run(
+            "api:app",
+            host=args.host,
+            port=args.port,
+            reload=True,  # Auto-reload on code changes
+            log_level="info",
+            access_log=False,  # Skip per-request access log lines
+            proxy_headers=False  # Not running behind a reverse proxy
+        )
+    else:
+        # Production: several worker processes (reload is not supported here)
+        uvicorn.run(
+            "api:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level="info",
+            access_log=False,
+            proxy_headers=False
+        )
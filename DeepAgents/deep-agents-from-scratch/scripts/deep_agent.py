@@ -16,15 +16,21 @@ web search, file management, and task delegation capabilities.
 # ============================================================================
 
 # Standard library
+import asyncio
+import hashlib
+import logging
 import os
+import secrets
 import sys
 import warnings
+import weakref
+from contextvars import ContextVar
 from datetime import datetime
-import uuid
-import base64
+from typing import AsyncIterator, Optional
 
 # Third-party packages
 import httpx
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from IPython.display import Image, display
 from markdownify import markdownify
@@ -34,13 +40,16 @@ from typing_extensions import Annotated, Literal
 # LangChain and LangGraph
 from langchain.agents import create_agent
 from langchain.chat_models import init_chat_model
+from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
 from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_core.tools import InjectedToolArg, InjectedToolCallId, tool
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 from tavily import TavilyClient
 
 # Local imports
+from deep_agents_from_scratch.file_store import get_file_store
 from deep_agents_from_scratch.file_tools import ls, read_file, write_file
 from deep_agents_from_scratch.prompts import (
     FILE_USAGE_INSTRUCTIONS,
@@ -66,6 +75,8 @@ sys.path.insert(0, os.path.dirname(__file__))
 env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
 load_dotenv(env_path, override=True)
 
+log = logging.getLogger("deep_agent")
+
 # Suppress LangSmith warnings
 warnings.filterwarnings("ignore", message="LangSmith now uses UUID v7", category=UserWarning)
 
@@ -77,10 +88,35 @@ MAX_CONCURRENT_RESEARCH_UNITS = 3
 MAX_RESEARCHER_ITERATIONS = 3
 RECURSION_LIMIT = 15
 HTTP_TIMEOUT = 30.0
+MAX_HTML_CHARS = 200_000  # HTML passed to markdownify
+MAX_CONTENT_CHARS = 40_000  # Markdown kept per page and sent to the summarizer
+SUMMARY_MAX_CONCURRENCY = 8  # Parallel summarization requests per search
+MAX_CONCURRENT_OUTBOUND = MAX_CONCURRENT_RESEARCH_UNITS * 4  # Page fetches + summarizer calls, process-wide
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 3600  # seconds
+
+# Summarization model, search client and HTTP client: created on first use, or
+# supplied by the host application via set_clients() (the API builds them in
+# its lifespan, the worker in its startup hook)
+summarization_model = None
+tavily_client: Optional[TavilyClient] = None
+httpx_client: Optional[httpx.AsyncClient] = None
+# HTTP client owned by the current run_agent()/main() call, if any
+_run_httpx_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "run_httpx_client", default=None
+)
+
+# Caps in-flight page fetches and summarizer calls across all concurrent
+# searches (complements the socket limits of the shared HTTP client). One per
+# event loop: a semaphore binds to the loop that first waits on it, and
+# run_agent() starts a new loop on every call
+_outbound_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-# Initialize global models and clients
-summarization_model = init_chat_model(model=SUMMARIZATION_MODEL_NAME)
-tavily_client = TavilyClient()
+# Processed search results keyed by (query, topic, max_results)
+_search_cache: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+# Page summaries keyed by content hash, so identical pages are summarized once
+_summary_cache: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
 
 
 # ============================================================================
@@ -97,12 +133,84 @@ class Summary(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================================
 
+def create_httpx_client() -> httpx.AsyncClient:
+    """Build the HTTP client used to fetch search result pages.
+
+    Pooled keep-alive connections are reused across searches; the owner
+    must ``aclose()`` it on shutdown.
+    """
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+def set_clients(tavily: TavilyClient, summarizer, http_client: httpx.AsyncClient) -> None:
+    """Use the given clients for searches.
+    
+    Args:
+        tavily: Tavily search client
+        summarizer: Chat model used to summarize webpages
+        http_client: Async HTTP client used to fetch webpages
+    """
+    global tavily_client, summarization_model, httpx_client
+    tavily_client = tavily
+    summarization_model = summarizer
+    httpx_client = http_client
+
+
+def get_tavily_client() -> TavilyClient:
+    """Get the shared Tavily client, creating it on first use."""
+    global tavily_client
+    if tavily_client is None:
+        tavily_client = TavilyClient()
+    return tavily_client
+
+
+def get_summarization_model():
+    """Get the shared summarization model, creating it on first use."""
+    global summarization_model
+    if summarization_model is None:
+        summarization_model = init_chat_model(model=SUMMARIZATION_MODEL_NAME)
+    return summarization_model
+
+
+def get_httpx_client() -> httpx.AsyncClient:
+    """Get the HTTP client for the current run.
+
+    The client owned by a ``run_agent()`` call comes first, then the one
+    installed with ``set_clients()``. Otherwise a shared client is created on
+    first use; it stays bound to that event loop, so it only suits callers
+    that keep one loop (e.g. ``await arun_agent(...)`` in Jupyter).
+    """
+    run_client = _run_httpx_client.get()
+    if run_client is not None:
+        return run_client
+    global httpx_client
+    if httpx_client is None:
+        httpx_client = create_httpx_client()
+    return httpx_client
+
+
+def _get_outbound_semaphore() -> asyncio.Semaphore:
+    """Get the outbound request semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _outbound_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _outbound_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_OUTBOUND)
+    return semaphore
+
+
 def get_today_str() -> str:
     """Get current date in a human-readable format."""
-    print("📅 Running: get_today_str()")
     return datetime.now().strftime("%a %b %d, %Y")
 
 
+def _search_cache_key(query: str, topic: str, max_results: int) -> tuple:
+    """Build the search cache key, ignoring case and whitespace differences."""
+    return (" ".join(query.lower().split()), topic, max_results)
+
+
 def run_tavily_search(
     search_query: str,
     max_results: int = 1,
@@ -120,8 +228,8 @@ def run_tavily_search(
     Returns:
         Search results dictionary
     """
-    print(f"🔍 Running: run_tavily_search(query='{search_query}', max_results={max_results})")
-    result = tavily_client.search(
+    log.debug("🔍 Running: run_tavily_search(query='%s', max_results=%d)", search_query, max_results)
+    result = get_tavily_client().search(
         search_query,
         max_results=max_results,
         include_raw_content=include_raw_content,
@@ -130,79 +238,167 @@ def run_tavily_search(
     return result
 
 
-def summarize_webpage_content(webpage_content: str) -> Summary:
-    """Summarize webpage content using the configured summarization model.
+def _content_digest(content: str) -> str:
+    """Short content hash used to name result files and deduplicate pages."""
+    return hashlib.blake2b(content.encode("utf-8", "ignore"), digest_size=6).hexdigest()
+
+
+def _fallback_summary(webpage_content: str) -> Summary:
+    """Build a basic summary when the summarization model fails."""
+    return Summary(
+        filename="search_result.md",
+        summary=webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+    )
+
+
+async def summarize_webpage_contents(
+    webpage_contents: list[str], today: str
+) -> list[tuple[Summary, bool]]:
+    """Summarize several webpages with one batched call to the summarization model.
     
     Args:
-        webpage_content: Raw webpage content to summarize
+        webpage_contents: Raw webpage contents to summarize
+        today: Current date string for the prompt
         
     Returns:
-        Summary object with filename and summary
+        (Summary, fell_back) pairs in input order; fell_back is True when the
+        model failed and the basic fallback summary was used instead
     """
-    print(f"📝 Running: summarize_webpage_content(content_length={len(webpage_content)})")
-    try:
-        structured_model = summarization_model.with_structured_output(Summary)
-        summary_and_filename = structured_model.invoke([
-            HumanMessage(content=SUMMARIZE_WEB_SEARCH.format(
+    log.debug("📝 Running: summarize_webpage_contents(num_pages=%d)", len(webpage_contents))
+    if not webpage_contents:
+        return []
+
+    structured_model = get_summarization_model().with_structured_output(Summary)
+
+    async def summarize(messages: list[HumanMessage], config: RunnableConfig) -> Summary:
+        async with _get_outbound_semaphore():
+            return await structured_model.ainvoke(messages, config)
+
+    summaries = await RunnableLambda(summarize).abatch(
+        [
+            [HumanMessage(content=SUMMARIZE_WEB_SEARCH.format(
                 webpage_content=webpage_content,
-                date=get_today_str()
-            ))
-        ])
-        return summary_and_filename
-    except Exception:
-        # Return basic summary on failure
-        return Summary(
-            filename="search_result.md",
-            summary=webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+                date=today
+            ))]
+            for webpage_content in webpage_contents
+        ],
+        config={"max_concurrency": SUMMARY_MAX_CONCURRENCY},
+        return_exceptions=True,
+    )
+
+    # Return basic summary for the pages that failed
+    return [
+        (summary, False) if isinstance(summary, Summary) else (_fallback_summary(webpage_content), True)
+        for summary, webpage_content in zip(summaries, webpage_contents)
+    ]
+
+
+async def _fetch_content(result: dict, client: httpx.AsyncClient) -> tuple[str, Summary | None]:
+    """Get the content of a single search result, fetching the page only if needed.
+
+    Tavily already returns the page content when ``include_raw_content`` is
+    set, so the URL is only fetched when that content is missing.
+
+    Args:
+        result: One entry of the Tavily results list
+        client: Shared async HTTP client
+
+    Returns:
+        Tuple of raw content and an error summary (None when content was found)
+    """
+    raw_content = (result.get('raw_content') or '')[:MAX_CONTENT_CHARS]
+    if raw_content:
+        return raw_content, None
+
+    try:
+        async with _get_outbound_semaphore():
+            response = await client.get(result['url'])
+    
+        if response.status_code == 200:
+            # HTML -> Markdown is CPU-bound; run it in a worker thread
+            html = response.text[:MAX_HTML_CHARS]
+            raw_content = await asyncio.to_thread(markdownify, html)
+            return raw_content[:MAX_CONTENT_CHARS], None
+
+        return '', Summary(
+            filename="URL_error.md",
+            summary=result.get('content', 'Error reading URL; try another search.')
+        )
+    except (httpx.TimeoutException, httpx.RequestError):
+        return '', Summary(
+            filename="connection_error.md",
+            summary=result.get('content', 'Could not fetch URL (timeout/connection error). Try another search.')
         )
 
 
-def process_search_results(results: dict) -> list[dict]:
+async def process_search_results(results: dict, today: str) -> list[dict]:
     """Process search results by summarizing content where available.
 
+    Page contents are gathered concurrently, then all pages are summarized
+    in one batched model call; output keeps the order of the input results.
+
     Args:
         results: Tavily search results dictionary
+        today: Current date string for the summarization prompt
 
     Returns:
-        List of processed results with summaries
+        List of processed results with summaries; ``degraded`` marks results
+        that came from a fetch error or a fallback summary
     """
-    print(f"⚙️ Running: process_search_results(num_results={len(results.get('results', []))})")
-    processed_results = []
-    httpx_client = httpx.Client(timeout=HTTP_TIMEOUT)
+    search_results = results.get('results', [])
+    log.debug("⚙️ Running: process_search_results(num_results=%d)", len(search_results))
 
-    for result in results.get('results', []):
-        url = result['url']
+    client = get_httpx_client()
+    fetched = await asyncio.gather(
+        *[_fetch_content(result, client) for result in search_results]
+    )
 
-        try:
-            response = httpx_client.get(url)
-        
-            if response.status_code == 200:
-                raw_content = markdownify(response.text)
-                summary_obj = summarize_webpage_content(raw_content)
-            else:
-                raw_content = result.get('raw_content', '')
-                summary_obj = Summary(
-                    filename="URL_error.md",
-                    summary=result.get('content', 'Error reading URL; try another search.')
-                )
-        except (httpx.TimeoutException, httpx.RequestError):
-            raw_content = result.get('raw_content', '')
-            summary_obj = Summary(
-                filename="connection_error.md",
-                summary=result.get('content', 'Could not fetch URL (timeout/connection error). Try another search.')
-            )
-
-        # Generate unique filename
-        uid = base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")[:8]
+    # Key pages by content hash: identical pages map to the same file and
+    # are only sent to the summarizer once
+    digests = [
+        _content_digest(raw_content) if error_summary is None else None
+        for raw_content, error_summary in fetched
+    ]
+    summaries_by_digest = {}
+    for digest in digests:
+        if digest is not None and (cached := _summary_cache.get(digest)) is not None:
+            summaries_by_digest[digest] = cached
+
+    # Summarize the remaining pages in a single batch
+    pending = {
+        digest: raw_content
+        for digest, (raw_content, _) in zip(digests, fetched)
+        if digest is not None and digest not in summaries_by_digest
+    }
+    summaries = await summarize_webpage_contents(list(pending.values()), today)
+    fallback_digests = set()
+    for digest, (summary_obj, fell_back) in zip(pending, summaries):
+        summaries_by_digest[digest] = summary_obj
+        # Only cache real summaries so a transient model failure is retried
+        if fell_back:
+            fallback_digests.add(digest)
+        else:
+            _summary_cache[digest] = summary_obj
+
+    processed_results = []
+    for result, (raw_content, error_summary), digest in zip(search_results, fetched, digests):
+        if digest is not None:
+            summary_obj = summaries_by_digest[digest]
+            uid = digest
+        else:
+            # Failed fetches have no content to hash; keep their files distinct
+            summary_obj = error_summary
+            uid = secrets.token_urlsafe(6)
         name, ext = os.path.splitext(summary_obj.filename)
-        summary_obj.filename = f"{name}_{uid}{ext}"
 
         processed_results.append({
             'url': result['url'],
             'title': result['title'],
             'summary': summary_obj.summary,
-            'filename': summary_obj.filename,
+            'filename': f"{name}_{uid}{ext}",
             'raw_content': raw_content,
+            # Fetch error or fallback summary: not worth caching
+            'degraded': digest is None or digest in fallback_digests,
         })
 
     return processed_results
@@ -213,7 +409,7 @@ def process_search_results(results: dict) -> list[dict]:
 # ============================================================================
 
 @tool(parse_docstring=True)
-def tavily_search(
+async def tavily_search(
     query: str,
     state: Annotated[DeepAgentState, InjectedState],
     tool_call_id: Annotated[str, InjectedToolCallId],
@@ -235,23 +431,41 @@ def tavily_search(
     Returns:
         Command that saves full results to files and provides minimal summary
     """
-    print(f"🔧 Running TOOL: tavily_search(query='{query}')")
+    log.debug("🔧 Running TOOL: tavily_search(query='%s')", query)
+    today = get_today_str()
     
-    search_results = run_tavily_search(query, max_results=max_results, topic=topic, include_raw_content=True)
-    processed_results = process_search_results(search_results)
+    # Repeated queries skip Tavily, page fetches and summarization entirely
+    cache_key = _search_cache_key(query, topic, max_results)
+    processed_results = _search_cache.get(cache_key)
+
+    if processed_results is None:
+        # Tavily's client is synchronous, so keep it off the event loop
+        search_results = await asyncio.to_thread(
+            run_tavily_search, query, max_results=max_results, topic=topic, include_raw_content=True
+        )
+        processed_results = await process_search_results(search_results, today)
+        if not any(result['degraded'] for result in processed_results):
+            _search_cache[cache_key] = processed_results
     
-    files = state.get("files", {})
-    saved_files = []
+    # Identical pages from different URLs share a filename: merge them into
+    # one file that lists every source
+    results_by_file = {}
+    for result in processed_results:
+        results_by_file.setdefault(result['filename'], []).append(result)
+    
+    file_contents = {}
     summaries = []
     
-    for result in processed_results:
-        filename = result['filename']
+    for filename, results in results_by_file.items():
+        result = results[0]
+        titles = " / ".join(dict.fromkeys(r['title'] for r in results))
+        urls = "  \n".join(f"**URL:** {r['url']}" for r in results)
         
-        file_content = f"""# Search Result: {result['title']}  
+        file_content = f"""# Search Result: {titles}  
 
-**URL:** {result['url']}  
+{urls}  
 **Query:** {query}  
-**Date:** {get_today_str()}  
+**Date:** {today}  
 
 ## Summary
 {result['summary']}  
@@ -259,17 +473,20 @@ def tavily_search(
 {result['raw_content'] if result['raw_content'] else 'No raw content available'}  
 """
         
-        files[filename] = file_content
-        saved_files.append(filename)
+        file_contents[filename] = file_content
         summaries.append(f"- {filename}: {result['summary']}...")
     
     summary_text = f"""🔍 Found {len(processed_results)} result(s) for '{query}':  
 
 {chr(10).join(summaries)}  
 
-Files: {', '.join(saved_files)}  
+Files: {', '.join(file_contents)}  
 💡 Use read_file() to access full details when needed.""" 
 
+    # Contents go to the file store; state only keeps filename -> content hash
+    hashes = await asyncio.to_thread(get_file_store().put_many, list(file_contents.values()))
+    files = dict(zip(file_contents, hashes))
+
     return Command(
         update={
             "files": files,
@@ -304,7 +521,7 @@ def think_tool(reflection: str) -> str:
     Returns:
         Confirmation that reflection was recorded for decision-making
     """
-    print(f"💭 Running TOOL: think_tool(reflection='{reflection[:50]}...')")
+    log.debug("💭 Running TOOL: think_tool(reflection='%.50s...')", reflection)
     return f"Reflection recorded: {reflection}"
 
 
@@ -336,7 +553,6 @@ all_tools = sub_agent_tools + built_in_tools + delegation_tools
 SUBAGENT_INSTRUCTIONS = SUBAGENT_USAGE_INSTRUCTIONS.format(
     max_concurrent_research_units=MAX_CONCURRENT_RESEARCH_UNITS,
     max_researcher_iterations=MAX_RESEARCHER_ITERATIONS,
-    date=datetime.now().strftime("%a %b %d, %Y"),
 )
 
 INSTRUCTIONS = (
@@ -355,11 +571,15 @@ INSTRUCTIONS = (
 )
 
 # Create main agent
+# INSTRUCTIONS is static (no date or per-run values), so the prompt prefix stays
+# identical across turns: OpenAI caches it automatically, and Anthropic models
+# get an explicit cache_control breakpoint from the middleware.
 agent = create_agent(
     model,
     all_tools,
     system_prompt=INSTRUCTIONS,
     state_schema=DeepAgentState,
+    middleware=[AnthropicPromptCachingMiddleware(unsupported_model_behavior="ignore")],
 )
 
 
@@ -367,32 +587,51 @@ agent = create_agent(
 # MAIN EXECUTION
 # ============================================================================
 
-def run_agent(question: str, verbose: bool = False) -> dict:
-    """Run the agent programmatically (for API usage).
-    
+# Whether the current run is verbose; each run (API request, worker job)
+# has its own context, so concurrent runs do not share the setting
+_verbose: ContextVar[bool] = ContextVar("verbose", default=False)
+
+
+class _VerboseFilter(logging.Filter):
+    """Drop DEBUG records unless the run that emitted them is verbose."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or _verbose.get()
+
+
+def configure_logging() -> None:
+    """Set up logging for an entrypoint (CLI, API or worker).
+
+    The filtered handler is attached only to this project's loggers, which
+    do not propagate to the root logger, so loggers configured by the host
+    (uvicorn, arq) are left alone and nothing is printed twice. The agent
+    loggers always emit DEBUG records; the filter only lets them through
+    for verbose runs.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.addFilter(_VerboseFilter())
+    for name in ("deep_agent", "deep_agents_from_scratch", "api"):
+        logger = logging.getLogger(name)
+        logger.handlers = [handler]  # Replace, so repeated calls do not duplicate
+        logger.propagate = False
+        if name != "api":
+            logger.setLevel(logging.DEBUG)
+
+
+def _format_result(question: str, result: dict) -> dict:
+    """Extract the final answer and metadata from the agent's final state.
+
+    Only counts of files and todos are returned, not their contents, so the
+    raw page content saved during research is not copied or serialized.
+
     Args:
-        question: User question to process
-        verbose: Whether to print execution logs
-        
+        question: User question that was processed
+        result: Final agent state
+
     Returns:
         Dictionary with answer and metadata
     """
-    if verbose:
-        print(f"🤖 Processing question: {question}")
-    
-    result = agent.invoke(
-        {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": question,
-                }
-            ],
-        },
-        config={"recursion_limit": RECURSION_LIMIT}
-    )
-    
-    # Extract final answer
     messages = result.get("messages", [])
     final_message = messages[-1] if messages else None
     
@@ -409,13 +648,108 @@ def run_agent(question: str, verbose: bool = False) -> dict:
         "answer": answer,
         "question": question,
         "message_count": len(messages),
-        "files": result.get("files", {}),
-        "todos": result.get("todos", [])
+        "file_count": len(result.get("files", {})),
+        "todos_count": len(result.get("todos", []))
     }
 
 
+async def _run_with_own_client(coro):
+    """Await ``coro`` with its own HTTP client, closed when it finishes.
+
+    ``asyncio.run()`` starts a new event loop on every call, and connections
+    opened on a previous loop cannot be reused.
+    """
+    async with create_httpx_client() as client:
+        _run_httpx_client.set(client)
+        return await coro
+
+
+def run_agent(question: str, verbose: bool = False) -> dict:
+    """Run the agent programmatically (for API usage).
+
+    Synchronous wrapper around ``arun_agent``; the search tool is async, so
+    the graph must be executed on an event loop. Each call uses its own HTTP
+    client. It cannot be called from a running event loop (e.g. Jupyter);
+    use ``await arun_agent(...)`` there.
+    
+    Args:
+        question: User question to process
+        verbose: Whether to print execution logs
+        
+    Returns:
+        Dictionary with answer and metadata
+    """
+    return asyncio.run(_run_with_own_client(arun_agent(question, verbose=verbose)))
+
+
+async def arun_agent(question: str, verbose: bool = False) -> dict:
+    """Run the agent asynchronously (for async API usage).
+
+    Uses ``agent.ainvoke`` so the event loop stays free to serve other
+    requests while this run waits on LLM and HTTP I/O.
+    
+    Args:
+        question: User question to process
+        verbose: Whether to print execution logs
+        
+    Returns:
+        Dictionary with answer and metadata
+    """
+    token = _verbose.set(verbose)
+    try:
+        log.debug("🤖 Processing question: %s", question)
+        
+        result = await agent.ainvoke(
+            {
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": question,
+                    }
+                ],
+            },
+            config={"recursion_limit": RECURSION_LIMIT}
+        )
+    finally:
+        _verbose.reset(token)
+    
+    return _format_result(question, result)
+
+
+async def astream_agent(question: str, verbose: bool = False) -> AsyncIterator[dict]:
+    """Stream agent events as the run progresses (for streaming API usage).
+    
+    Args:
+        question: User question to process
+        verbose: Whether to print execution logs
+        
+    Yields:
+        LangChain ``astream_events`` (v2) event dictionaries
+    """
+    # Set in the streaming task's context; there is nothing to reset
+    _verbose.set(verbose)
+    log.debug("🤖 Streaming question: %s", question)
+    
+    async for event in agent.astream_events(
+        {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": question,
+                }
+            ],
+        },
+        config={"recursion_limit": RECURSION_LIMIT},
+        version="v2",
+    ):
+        yield event
+
+
 def main():
     """Execute the deep research agent (CLI mode)."""
+    configure_logging()
+    _verbose.set("--verbose" in sys.argv[1:])
+
     print("\n" + "="*80)
     print("🚀 STARTING AGENT EXECUTION")
     print("="*80 + "\n")
@@ -423,7 +757,7 @@ def main():
     user_question = input("💬 Enter your question: ")
     print()
 
-    result = agent.invoke(
+    result = asyncio.run(_run_with_own_client(agent.ainvoke(
         {
             "messages": [
                 {
@@ -433,7 +767,7 @@ def main():
             ],
         },
         config={"recursion_limit": RECURSION_LIMIT}
-    )
+    )))
 
     print("\n" + "="*80)
     print("✅ EXECUTION COMPLETED")
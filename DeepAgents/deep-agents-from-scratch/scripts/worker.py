@@ -0,0 +1,87 @@
+"""Deep Research Agent - Background Worker.
+
+This module runs agent jobs enqueued by the API on an arq (Redis-backed)
+task queue, so long research runs never occupy an API worker slot.
+
+Run with: arq worker.WorkerSettings
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import os
+import sys
+
+from arq.connections import RedisSettings
+from langchain.chat_models import init_chat_model
+from tavily import TavilyClient
+
+# Add scripts folder to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+# Import agent
+from deep_agent import (
+    SUMMARIZATION_MODEL_NAME,
+    arun_agent,
+    configure_logging,
+    create_httpx_client,
+    set_clients,
+)
+
+# ============================================================================
+# CONFIGURATION AND CONSTANTS
+# ============================================================================
+
+REDIS_SETTINGS = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))
+JOB_TIMEOUT = 1800  # seconds; deep research runs can take several minutes
+MAX_JOBS = int(os.getenv("WORKER_MAX_JOBS", "10"))  # Concurrent jobs per worker
+
+
+# ============================================================================
+# JOBS
+# ============================================================================
+
+async def run_agent_job(ctx: dict, question: str, verbose: bool = False) -> dict:
+    """Run the agent for a queued question.
+
+    Args:
+        ctx: arq job context
+        question: User question to process
+        verbose: Whether to print execution logs
+
+    Returns:
+        Dictionary with answer and metadata (stored as the job result)
+    """
+    return await arun_agent(question, verbose=verbose)
+
+
+async def startup(ctx: dict) -> None:
+    """Set up logging and create the shared clients when the worker starts."""
+    configure_logging()
+    ctx["httpx"] = create_httpx_client()
+    set_clients(
+        tavily=TavilyClient(),
+        summarizer=init_chat_model(model=SUMMARIZATION_MODEL_NAME),
+        http_client=ctx["httpx"],
+    )
+
+
+async def shutdown(ctx: dict) -> None:
+    """Close the shared HTTP client when the worker stops."""
+    await ctx["httpx"].aclose()
+
+
+# ============================================================================
+# WORKER SETTINGS
+# ============================================================================
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [run_agent_job]
+    redis_settings = REDIS_SETTINGS
+    on_startup = startup
+    on_shutdown = shutdown
+    job_timeout = JOB_TIMEOUT
+    max_jobs = MAX_JOBS
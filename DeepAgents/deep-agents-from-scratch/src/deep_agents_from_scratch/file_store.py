@@ -0,0 +1,127 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Optional
+
+# SQLite database holding file contents (shared by API, worker and CLI
+# processes); overridden by FILE_STORE_PATH
+DEFAULT_FILE_STORE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "agent_files.db")
+# Contents not stored again within this many seconds are evicted; overridden
+# by FILE_STORE_TTL
+DEFAULT_FILE_STORE_TTL = 7 * 24 * 3600
+
+
+def content_hash(content: str) -> str:
+    """Compute the content address used as a file's key in the store.
+
+    Args:
+        content: File content
+
+    Returns:
+        Hex digest identifying the content
+    """
+    return hashlib.blake2b(content.encode("utf-8", "ignore"), digest_size=16).hexdigest()
+
+
+class FileStore:
+    """Content-addressable file storage backed by SQLite.
+
+    Agent state only keeps ``filename -> hash``; the contents live here, so
+    checkpoints and state updates no longer copy every saved webpage.
+    Identical contents are stored once. Rows older than ``ttl`` seconds are
+    evicted on write, so the database does not grow without bound.
+    """
+
+    def __init__(self, path: str, ttl: int = DEFAULT_FILE_STORE_TTL):
+        """Open (and create if needed) the store at the given path.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds a content is kept after it was last stored
+        """
+        self.path = path
+        self.ttl = ttl
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")  # Concurrent readers across processes
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "hash TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Stores created before eviction existed lack the timestamp column
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+            if "created_at" not in columns:
+                conn.execute("ALTER TABLE files ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS files_created_at ON files (created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def put(self, content: str) -> str:
+        """Store content and return its hash.
+
+        Args:
+            content: File content
+
+        Returns:
+            Content hash to keep in agent state
+        """
+        return self.put_many([content])[0]
+
+    def put_many(self, contents: list[str]) -> list[str]:
+        """Store several contents in one transaction and evict expired ones.
+
+        Storing a content again refreshes its timestamp.
+
+        Args:
+            contents: File contents
+
+        Returns:
+            Content hashes, in input order
+        """
+        hashes = [content_hash(content) for content in contents]
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT INTO files (hash, content, created_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (hash) DO UPDATE SET created_at = excluded.created_at",
+                [(hash_, content, now) for hash_, content in zip(hashes, contents)],
+            )
+            conn.execute("DELETE FROM files WHERE created_at < ?", (now - self.ttl,))
+        return hashes
+
+    def get(self, hash_: str) -> Optional[str]:
+        """Load content by hash.
+
+        Args:
+            hash_: Content hash from agent state
+
+        Returns:
+            File content, or None if the hash is unknown or expired
+        """
+        # Expired rows may still be present until the next write evicts them
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT content FROM files WHERE hash = ? AND created_at >= ?",
+                (hash_, time.time() - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+
+_file_store: Optional[FileStore] = None
+
+
+def get_file_store() -> FileStore:
+    """Get the shared file store, opening it on first use.
+
+    ``FILE_STORE_PATH`` and ``FILE_STORE_TTL`` are read here rather than at
+    import, so values loaded from ``.env`` by the entrypoint are honoured.
+    """
+    global _file_store
+    if _file_store is None:
+        _file_store = FileStore(
+            os.getenv("FILE_STORE_PATH", DEFAULT_FILE_STORE_PATH),
+            ttl=int(os.getenv("FILE_STORE_TTL", str(DEFAULT_FILE_STORE_TTL))),
+        )
+    return _file_store
@@ -1,3 +1,4 @@
+import logging
 from typing import Annotated
 
 from langchain_core.messages import ToolMessage
@@ -5,6 +6,7 @@ from langchain_core.tools import InjectedToolCallId, tool
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 
+from deep_agents_from_scratch.file_store import get_file_store
 from deep_agents_from_scratch.prompts import (
     LS_DESCRIPTION,
     READ_FILE_DESCRIPTION,
@@ -12,11 +14,13 @@ from deep_agents_from_scratch.prompts import (
 )
 from deep_agents_from_scratch.state import DeepAgentState
 
+log = logging.getLogger(__name__)
+
 
 @tool(description=LS_DESCRIPTION)
 def ls(state: Annotated[DeepAgentState, InjectedState]) -> list[str]:
     """List all files in the virtual filesystem."""
-    print("estou no ls")  # Debug print to confirm function call
+    log.debug("estou no ls")  # Debug log to confirm function call
     return list(state.get("files", {}).keys())
 
 
@@ -38,12 +42,14 @@ def read_file(
     Returns:
         Formatted file content with line numbers, or error message if file not found
     """
-    print("estou no read_file")  # Debug print to confirm function call
+    log.debug("estou no read_file")  # Debug log to confirm function call
     files = state.get("files", {})
     if file_path not in files:
         return f"Error: File '{file_path}' not found"
 
-    content = files[file_path]
+    content = get_file_store().get(files[file_path])
+    if content is None:
+        return f"Error: File '{file_path}' has expired from the file store"
     if not content:
         return "System reminder: File exists but has empty contents"
 
@@ -80,13 +86,12 @@ def write_file(
     Returns:
         Command to update agent state with new file content
     """
-    print("estou no write_file")  # Debug print to confirm function call
+    log.debug("estou no write_file")  # Debug log to confirm function call
 
-    files = state.get("files", {})
-    files[file_path] = content
+    # Contents go to the file store; state only keeps filename -> content hash
     return Command(
         update={
-            "files": files,
+            "files": {file_path: get_file_store().put(content)},
             "messages": [
                 ToolMessage(f"Updated file {file_path}", tool_call_id=tool_call_id)
             ],
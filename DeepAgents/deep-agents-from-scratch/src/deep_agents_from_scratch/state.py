@@ -1,9 +1,12 @@
+import logging
 from typing import Annotated, Literal, NotRequired
 from typing_extensions import TypedDict
 
 #from langgraph.prebuilt.chat_agent_executor import AgentState
 from langchain.agents import AgentState  # updated in 1.0
 
+log = logging.getLogger(__name__)
+
 class Todo(TypedDict):
     """A structured task item for tracking progress through complex workflows.
 
@@ -29,7 +32,7 @@ def file_reducer(left, right):
     Returns:
         Merged dictionary with right values overriding left values
     """
-    print("estou no file_reducer")  # Debug print to confirm function call
+    log.debug("estou no file_reducer")  # Debug log to confirm function call
 
     if left is None:
         return right
@@ -45,6 +48,7 @@ class DeepAgentState(AgentState):
     Inherits from LangGraph's AgentState and adds:
     - todos: List of Todo items for task planning and progress tracking
     - files: Virtual file system stored as dict mapping filenames to content
+      hashes; the contents themselves live in the FileStore
     """
 
     todos: NotRequired[list[Todo]]
@@ -1,16 +1,31 @@
+import logging
+import threading
+from collections.abc import Mapping, Sequence
 from typing import Annotated, NotRequired
 from typing_extensions import TypedDict
 
+from cachetools import TTLCache
+
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import BaseTool, InjectedToolCallId, tool
 from langgraph.prebuilt import InjectedState  # updated 1.0
 from langchain.agents import create_agent  # updated 1.0
 
-from langgraph.types import Command
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import CachePolicy, Command
 
 from deep_agents_from_scratch.prompts import TASK_DESCRIPTION_PREFIX
 from deep_agents_from_scratch.state import DeepAgentState
 
+log = logging.getLogger(__name__)
+
+
+# How long a sub-agent result is reused for an identical task description
+SUBAGENT_CACHE_TTL = 3600  # seconds
+# Entries hold full sub-agent transcripts, so keep only the most recent ones
+SUBAGENT_CACHE_SIZE = 128
+
 
 class SubAgent(TypedDict):
     """Configuration for a specialized sub-agent."""
@@ -21,6 +36,96 @@ class SubAgent(TypedDict):
     tools: NotRequired[list[str]]
 
 
+class _TTLNodeCache(BaseCache):
+    """LangGraph node cache with a size limit, backed by ``cachetools.TTLCache``.
+
+    LangGraph's ``InMemoryCache`` never evicts entries that are not read
+    again; this one drops the least recently used entry once full and
+    expires entries after ``ttl`` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__()
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.RLock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict:
+        with self._lock:
+            return {
+                key: self.serde.loads_typed(self._cache[key])
+                for key in keys
+                if key in self._cache
+            }
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict:
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple]) -> None:
+        # The cache-wide ttl applies; per-entry TTLs all come from the same policy
+        with self._lock:
+            for key, (value, _ttl) in pairs.items():
+                self._cache[key] = self.serde.dumps_typed(value)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple]) -> None:
+        self.set(pairs)
+
+    def clear(self, namespaces: Sequence[Namespace] | None = None) -> None:
+        with self._lock:
+            if namespaces is None:
+                self._cache.clear()
+            else:
+                for key in [key for key in self._cache if key[0] in namespaces]:
+                    del self._cache[key]
+
+    async def aclear(self, namespaces: Sequence[Namespace] | None = None) -> None:
+        self.clear(namespaces)
+
+
+def _cached_subagent(name: str, sub_agent, state_schema):
+    """Wrap a sub-agent in a single-node graph with LangGraph node caching.
+
+    The node is keyed on the task description, so a recurring subtask is
+    answered from cache instead of re-running the whole research loop.
+
+    Args:
+        name: Sub-agent name, used to namespace cache keys
+        sub_agent: Compiled sub-agent graph
+        state_schema: The state schema (typically DeepAgentState)
+
+    Returns:
+        Compiled graph that runs the sub-agent behind a node cache
+    """
+
+    async def run_subagent(state):
+        result = await sub_agent.ainvoke(state)
+        # Only return files the sub-agent changed, so a cached result never
+        # overwrites newer parent files with a stale snapshot
+        parent_files = state.get("files", {})
+        return {
+            "messages": result["messages"],
+            "files": {
+                path: content
+                for path, content in result.get("files", {}).items()
+                if parent_files.get(path) != content
+            },
+        }
+
+    builder = StateGraph(state_schema)
+    builder.add_node(
+        "subagent",
+        run_subagent,
+        cache_policy=CachePolicy(
+            key_func=lambda state: f"{name}:{state['messages'][-1].content}",
+            ttl=SUBAGENT_CACHE_TTL,
+        ),
+    )
+    builder.add_edge(START, "subagent")
+    builder.add_edge("subagent", END)
+    return builder.compile(
+        cache=_TTLNodeCache(maxsize=SUBAGENT_CACHE_SIZE, ttl=SUBAGENT_CACHE_TTL)
+    )
+
+
 def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
     """Create a task delegation tool that enables context isolation through sub-agents.
 
@@ -36,7 +141,7 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
     Returns:
         A 'task' tool that can delegate work to specialized sub-agents
     """
-    print("estou no task")  # Debug print to confirm function call
+    log.debug("estou no task")  # Debug log to confirm function call
 
     # Create agent registry
     agents = {}
@@ -56,9 +161,10 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
         else:
             # Default to all tools
             _tools = tools
-        agents[_agent["name"]] = create_agent(   # updated 1.0
+        sub_agent = create_agent(   # updated 1.0
             model, system_prompt=_agent["prompt"], tools=_tools, state_schema=state_schema
         )
+        agents[_agent["name"]] = _cached_subagent(_agent["name"], sub_agent, state_schema)
 
     # Generate description of available sub-agents for the tool description
     other_agents_string = [
@@ -66,7 +172,7 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
     ]
 
     @tool(description=TASK_DESCRIPTION_PREFIX.format(other_agents=other_agents_string))
-    def task(
+    async def task(
         description: str,
         subagent_type: str,
         state: Annotated[DeepAgentState, InjectedState],
@@ -77,7 +183,7 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
         This creates a fresh context for the sub-agent containing only the task description,
         preventing context pollution from the parent agent's conversation history.
         """
-        print("estou no task")  # Debug print to confirm function call
+        log.debug("estou no task")  # Debug log to confirm function call
 
         # Validate requested agent type exists
         if subagent_type not in agents:
@@ -91,7 +197,7 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
         state["messages"] = [{"role": "user", "content": description}]
 
         # Execute the sub-agent in isolation
-        result = sub_agent.invoke(state)
+        result = await sub_agent.ainvoke(state)
 
         # Return results to parent agent via Command state update
         return Command(
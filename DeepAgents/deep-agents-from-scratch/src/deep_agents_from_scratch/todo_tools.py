@@ -1,3 +1,4 @@
+import logging
 from typing import Annotated
 
 from langchain_core.messages import ToolMessage
@@ -8,6 +9,8 @@ from langgraph.types import Command
 from deep_agents_from_scratch.prompts import WRITE_TODOS_DESCRIPTION
 from deep_agents_from_scratch.state import DeepAgentState, Todo
 
+log = logging.getLogger(__name__)
+
 
 @tool(description=WRITE_TODOS_DESCRIPTION,parse_docstring=True)
 def write_todos(
@@ -22,7 +25,7 @@ def write_todos(
     Returns:
         Command to update agent state with new TODO list
     """
-    print("estou no write_todos")  # Debug print to confirm function call
+    log.debug("estou no write_todos")  # Debug log to confirm function call
     return Command(
         update={
             "todos": todos,
@@ -50,7 +53,7 @@ def read_todos(
     Returns:
         Formatted string representation of the current TODO list
     """
-    print("estou no read_todos")  # Debug print to confirm function call
+    log.debug("estou no read_todos")  # Debug log to confirm function call
     todos = state.get("todos", [])
     if not todos:
         return "No todos currently in the list."
@@ -62,10 +65,6 @@ def read_todos(
         result += f"{i}. {emoji} {todo['content']} ({todo['status']})\n"
 
     # Exibe o conteúdo dos TODOs para ver o que a LLM está lendo
-    print("\n" + "="*80)
-    print("📋 LLM ESTÁ LENDO OS TODOS:")
-    print("="*80)
-    print(result.strip())
-    print("="*80 + "\n")
+    log.debug("📋 LLM ESTÁ LENDO OS TODOS:\n%s", result.strip())
 
     return result.strip()
@@ -0,0 +1,59 @@
+import sqlite3
+import time
+
+from deep_agents_from_scratch.file_store import FileStore, content_hash
+
+
+def test_put_get_round_trip(tmp_path):
+    store = FileStore(str(tmp_path / "files.db"))
+    hash_ = store.put("# Notes\nhello")
+    assert hash_ == content_hash("# Notes\nhello")
+    assert store.get(hash_) == "# Notes\nhello"
+    assert store.get("unknown") is None
+
+
+def test_identical_contents_are_stored_once(tmp_path):
+    store = FileStore(str(tmp_path / "files.db"))
+    hashes = store.put_many(["same", "same", "other"])
+    assert hashes[0] == hashes[1] != hashes[2]
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 2
+
+
+def test_expired_content_returns_none(tmp_path):
+    store = FileStore(str(tmp_path / "files.db"), ttl=60)
+    hash_ = store.put("old")
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE files SET created_at = ?", (time.time() - 120,))
+    assert store.get(hash_) is None
+
+    # The next write evicts the expired row
+    store.put("new")
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 1
+
+
+def test_storing_again_refreshes_expiry(tmp_path):
+    store = FileStore(str(tmp_path / "files.db"), ttl=60)
+    hash_ = store.put("kept")
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE files SET created_at = ?", (time.time() - 120,))
+    store.put("kept")
+    assert store.get(hash_) == "kept"
+
+
+def test_opens_store_created_before_created_at(tmp_path):
+    path = str(tmp_path / "files.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE files (hash TEXT PRIMARY KEY, content TEXT NOT NULL)")
+        conn.execute("INSERT INTO files VALUES (?, ?)", (content_hash("legacy"), "legacy"))
+
+    store = FileStore(path)
+    with sqlite3.connect(path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+    assert "created_at" in columns
+
+    # Legacy rows have no timestamp, so they count as expired
+    assert store.get(content_hash("legacy")) is None
+    hash_ = store.put("fresh")
+    assert store.get(hash_) == "fresh"